@@ -9,18 +9,44 @@ cross-platform configuration.
 
 import sys
 import os
+import errno
 import json
 import pathlib
 import uuid
 import shutil
-import datetime
-from PySide6 import QtCore, QtWidgets, QtGui
-from PySide6.QtCore import Qt, QSettings, QStandardPaths
+import subprocess
+import functools
+import mmap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+try:
+    # Optional: much faster (SIMD, multithreaded) hashing for change detection
+    from blake3 import blake3 as _hasher
+    HASH_NAME = "blake3"
+    HASH_THREAD_ARGS = {"max_threads": _hasher.AUTO}
+except ImportError:
+    from hashlib import blake2b as _hasher
+    HASH_NAME = "blake2b"
+    HASH_THREAD_ARGS = {}
+
+try:
+    # Optional: faster parsing of 'games.json'
+    import msgspec
+except ImportError:
+    msgspec = None
+
+from PySide6.QtCore import (
+    Qt, QSettings, QStandardPaths, QFileSystemWatcher, QTimer,
+    QThreadPool, QObject, QThread, Signal
+)
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QDialog, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QWidget, QMessageBox, QFileDialog,
     QListWidget, QListWidgetItem, QLineEdit, QDialogButtonBox,
-    QFormLayout, QCheckBox
+    QFormLayout, QCheckBox, QProgressDialog
 )
 
 # --- Configuration Constants ---
@@ -33,6 +59,676 @@ APPLICATION_NAME = "RayforgeSync"
 CONFIG_SERVER_PATH = "server_path"
 CONFIG_GAMES_PATHS = "local_game_paths" # This will store the local path map
 CONFIG_SHOW_OVERWRITE_WARNING = "show_overwrite_warning"
+CONFIG_AUTO_UPLOAD = "auto_upload"
+CONFIG_USE_RSYNC = "use_rsync" # Opt-in: upload to network shares via rsync
+CONFIG_SERVER_CHECKED_AT = "server_checked_at" # Last successful startup check
+
+# --- Startup Check ---
+SERVER_CHECK_TIMEOUT = 3.0 # Seconds, instead of the OS's 30-60 s SMB timeout
+SERVER_CHECK_TTL = 60 # Seconds a successful check is trusted for
+
+# --- Transfer Settings ---
+BACKUP_TIMESTAMP_FORMAT = "%Y-%m-%d_%H-%M-%S" # Names the backup folders
+COPY_WORKERS = 8 # Parallel file copies, hides network share latency
+BULK_SYNC_WORKERS = 4 # Games transferred at once by "Upload/Download All"
+COPY_BUFFER_SIZE = 1 << 20 # 1 MiB, used when os.sendfile isn't available
+# sendfile() between regular files is only supported on Linux
+USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+# os.link errors that mean "no hardlinks on this filesystem", not a real failure
+LINK_UNSUPPORTED_ERRNOS = {
+    errno.EPERM, errno.EXDEV, errno.EMLINK, errno.ENOSYS,
+    getattr(errno, "EOPNOTSUPP", errno.ENOSYS), getattr(errno, "ENOTSUP", errno.ENOSYS),
+}
+LINK_UNSUPPORTED_WINERRORS = {1, 50} # ERROR_INVALID_FUNCTION, ERROR_NOT_SUPPORTED
+MMAP_MIN_SIZE = 1 << 20 # Hash files larger than this through mmap
+# Per-folder cache of file hashes, so unchanged files aren't re-read
+MANIFEST_NAME = ".rayforge_manifest.json"
+# Cleared save folders are renamed to "<name><suffix><random>" and deleted
+TRASH_SUFFIX = ".rayforge-old-"
+# Report transfer progress at most once per this many bytes
+PROGRESS_STEP = 4 << 20 # 4 MiB
+# Wait this long after the last change to a save folder before auto-uploading
+AUTO_UPLOAD_DELAY_MS = 2000
+AUTO_UPLOAD_RETRY_MS = 60000 # Retry a failed auto-upload after this long
+
+
+def _decode_games(raw):
+    """
+    Parses the bytes of 'games.json' and returns its list of games as dicts.
+    Raises ValueError if the file isn't valid JSON and TypeError if it
+    doesn't have the expected structure.
+    """
+    # Decoded untyped either way, so a bad entry is skipped with or
+    # without msgspec instead of rejecting the whole file
+    return _games_from_data(_decode_server_data(raw))
+
+
+def _games_from_data(data):
+    """Validates parsed 'games.json' data and returns its list of games."""
+    # Add validation for the JSON structure
+    if not isinstance(data, dict):
+        raise TypeError("JSON root is not an object/dictionary")
+    
+    games_list = data.get("games")
+    
+    if not isinstance(games_list, list):
+        raise TypeError("JSON 'games' key is not a list")
+
+    games = []
+    for game in games_list:
+        if not isinstance(game, dict):
+            print(f"Skipping invalid game entry: {game}")
+            continue
+        games.append(game)
+    return games
+
+
+def _decode_server_data(raw):
+    """
+    Parses 'games.json' as plain Python objects, keeping unknown fields.
+    Raises ValueError if it isn't valid JSON (msgspec.DecodeError is one).
+    """
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    return json.loads(raw)
+
+
+def _encode_server_data(data):
+    """Serializes the server data as indented JSON bytes."""
+    if msgspec is not None:
+        return msgspec.json.format(msgspec.json.encode(data), indent=4)
+    return json.dumps(data, indent=4).encode()
+
+
+def _write_file_atomic(path, data):
+    """
+    Writes 'data' to a temp file next to 'path', flushes it to disk and
+    then swaps it in with os.replace (which, unlike os.rename, also
+    overwrites an existing file on Windows).
+    """
+    tmp_path = os.fspath(path) + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, path)
+
+
+def _is_file_with_timeout(path, timeout):
+    """
+    Runs path.is_file() on a daemon thread, so a hung network share can't
+    freeze startup (or keep the process alive on exit).
+    Raises TimeoutError if there's no answer within 'timeout' seconds.
+    """
+    future = Future()
+
+    def check():
+        try:
+            future.set_result(path.is_file())
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=check, daemon=True).start()
+    try:
+        return future.result(timeout=timeout)
+    except FutureTimeoutError:
+        raise TimeoutError(f"No response from '{path}' after {timeout:g} seconds")
+
+
+def _copy_file(src_file, dst_file):
+    """
+    Copies a single file's data and metadata using large, unbuffered I/O.
+    The copy is written to a temp file and swapped in, so an existing
+    'dst_file' (which may be hardlinked into a backup) is never modified.
+    """
+    tmp_file = dst_file + ".rayforge-tmp"
+    try:
+        _copy_file_data(src_file, tmp_file)
+        shutil.copystat(src_file, tmp_file)
+        os.replace(tmp_file, dst_file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
+
+
+def _copy_file_data(src_file, dst_file):
+    """Copies a file's bytes with sendfile where possible."""
+    with open(src_file, 'rb', buffering=0) as s, open(dst_file, 'wb', buffering=0) as d:
+        copied = False
+        if USE_SENDFILE:
+            size = os.fstat(s.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(d.fileno(), s.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                copied = True
+            except OSError:
+                # Some filesystems (e.g. certain network mounts) reject
+                # sendfile. Fall back to a plain copy if nothing was written.
+                if offset:
+                    raise
+        if not copied:
+            shutil.copyfileobj(s, d, COPY_BUFFER_SIZE)
+
+
+def _parallel_copytree(src, dst, workers=COPY_WORKERS, files=None, progress=None):
+    """
+    Copies the *contents* of 'src' into 'dst' (like copytree with dirs_exist_ok).
+    Directories are created up front, then files are copied in parallel.
+    If 'files' is given, only those relative paths ('/'-separated) are copied.
+    If 'progress' is given, it's called with (bytes_done, bytes_total).
+    The first failed copy aborts the rest of the batch and is re-raised.
+    """
+    src = os.fspath(src)
+    dst = os.fspath(dst)
+
+    jobs = []
+    # Follow symlinked subfolders, like the manifest walkers do
+    for dir_path, dir_names, file_names in os.walk(src, followlinks=True):
+        rel_dir = os.path.relpath(dir_path, src)
+        dst_dir = os.path.normpath(os.path.join(dst, rel_dir))
+        os.makedirs(dst_dir, exist_ok=True)
+        rel_prefix = "" if rel_dir == os.curdir else rel_dir.replace(os.sep, "/") + "/"
+        for name in file_names:
+            rel = rel_prefix + name
+            if rel == MANIFEST_NAME:
+                continue # Each side keeps its own hash cache
+            if files is not None and rel not in files:
+                continue
+            jobs.append((os.path.join(dir_path, name), os.path.join(dst_dir, name)))
+
+    if not jobs:
+        return
+
+    sizes = {}
+    if progress:
+        sizes = {job[0]: os.path.getsize(job[0]) for job in jobs}
+    bytes_total = sum(sizes.values())
+    bytes_done = 0
+    last_reported = -PROGRESS_STEP
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        futures = {pool.submit(_copy_file, *job): job[0] for job in jobs}
+        try:
+            for future in as_completed(futures):
+                future.result()
+                if progress:
+                    bytes_done += sizes[futures[future]]
+                    if bytes_done - last_reported >= PROGRESS_STEP or bytes_done == bytes_total:
+                        progress(bytes_done, bytes_total)
+                        last_reported = bytes_done
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+
+def _link_files(src_root, dst_root, rel_paths):
+    """
+    Hardlinks the given relative paths from 'src_root' into 'dst_root'.
+    Returns False, after removing the links it made, if the filesystem
+    doesn't support hardlinks. Any other error is re-raised.
+    """
+    made = []
+    try:
+        for rel in rel_paths:
+            dst_file = os.path.join(dst_root, rel)
+            os.makedirs(os.path.dirname(dst_file), exist_ok=True)
+            os.link(os.path.join(src_root, rel), dst_file)
+            made.append(dst_file)
+    except OSError as e:
+        for dst_file in made:
+            os.remove(dst_file)
+        if (e.errno in LINK_UNSUPPORTED_ERRNOS
+                or getattr(e, "winerror", None) in LINK_UNSUPPORTED_WINERRORS):
+            return False
+        raise
+    return True
+
+
+def _snapshot_save(save_path, backup_dest, rel_paths, dirs=()):
+    """
+    Turns the new, empty 'backup_dest' into a complete, restorable copy
+    of the files 'rel_paths' and (possibly empty) subfolders 'dirs' of
+    'save_path'.
+    Returns True if this was done with hardlinks. Where the filesystem
+    doesn't support them, copying every unchanged file server-to-server
+    would be slow, so the whole folder is renamed to 'backup_dest' and
+    replaced by an empty one instead, and False is returned.
+    """
+    for rel in dirs:
+        os.makedirs(os.path.join(backup_dest, rel), exist_ok=True)
+    if _link_files(save_path, backup_dest, rel_paths):
+        return True
+    shutil.rmtree(backup_dest) # May hold subfolders the links were made in
+    os.rename(save_path, backup_dest)
+    os.mkdir(save_path)
+    shutil.copystat(backup_dest, save_path)
+    return False
+
+
+def _undo_snapshot(save_path, backup_dest):
+    """Puts a renamed save folder (see _snapshot_save) back in place."""
+    shutil.rmtree(save_path, ignore_errors=True)
+    os.rename(backup_dest, save_path)
+
+
+def _restore_snapshot(backup_root, save_path, rel_paths, dirs):
+    """
+    Makes 'save_path' match its hardlink snapshot (see _snapshot_save)
+    again: files and folders added since are removed, then the
+    snapshot's folders and files are put back.
+    """
+    rel_paths = set(rel_paths)
+    current_dirs = set()
+    for rel in _list_files(save_path, current_dirs):
+        if rel not in rel_paths:
+            os.remove(os.path.join(save_path, rel))
+    # Deepest first, a subfolder always sorts after its parent
+    for rel in sorted(current_dirs - set(dirs), reverse=True):
+        os.rmdir(os.path.join(save_path, rel))
+    for rel in dirs:
+        os.makedirs(os.path.join(save_path, rel), exist_ok=True)
+    _restore_linked_files(backup_root, save_path, rel_paths)
+
+
+def _restore_linked_files(backup_root, dst_root, rel_paths):
+    """Puts files back from a hardlink snapshot, leaving the snapshot intact."""
+    for rel in rel_paths:
+        backup_file = os.path.join(backup_root, rel)
+        dst_file = os.path.join(dst_root, rel)
+        try:
+            if os.path.samefile(backup_file, dst_file):
+                continue # Never replaced (and renaming onto a hardlink is a no-op)
+        except FileNotFoundError:
+            pass
+        tmp_file = dst_file + ".rayforge-tmp"
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        os.link(backup_file, tmp_file)
+        os.replace(tmp_file, dst_file)
+
+
+def _reserve_backup_dir(path):
+    """
+    Creates and returns a new, empty backup folder at 'path', or at
+    'path_2', 'path_3', ... if that name is taken (e.g. a second sync in
+    the same second), so an existing backup is never written into.
+    """
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    candidate = path
+    n = 1
+    while True:
+        try:
+            candidate.mkdir()
+            return candidate
+        except FileExistsError:
+            n += 1
+            candidate = path.with_name(f"{path.name}_{n}")
+
+
+def _has_entries(path):
+    """Returns True if a folder has at least one entry, without listing it all."""
+    with os.scandir(path) as it:
+        return next(it, None) is not None
+
+
+def _list_files(root, dirs=None):
+    """
+    Returns the relative paths ('/'-separated) of all files under 'root'.
+    If 'dirs' (a set) is given, the subfolders' relative paths are added to it.
+    """
+    files = []
+    pending = [("", os.fspath(root))]
+    while pending:
+        rel_prefix, dir_path = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel = rel_prefix + entry.name
+                if entry.is_dir():
+                    pending.append((rel + "/", entry.path))
+                    if dirs is not None:
+                        dirs.add(rel)
+                elif rel != MANIFEST_NAME:
+                    files.append(rel)
+    return files
+
+
+def _file_hash(path):
+    """
+    Returns the hex content hash of a file. Large files are memory-mapped
+    and, with blake3, hashed on multiple threads.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > MMAP_MIN_SIZE:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _hasher(mm, **HASH_THREAD_ARGS).hexdigest()
+        return _hasher(f.read()).hexdigest()
+
+
+def _load_manifest_cache(root):
+    """
+    Reads the {relpath: [mtime_ns, size, hash]} cache stored in 'root'.
+    A cache written with a different hash algorithm (e.g. by a machine
+    without blake3) is ignored, so its hashes are never compared to ours.
+    """
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("hash") != HASH_NAME:
+        return {}
+    cache = data.get("files")
+    return cache if isinstance(cache, dict) else {}
+
+
+def _save_manifest_cache(root, cache):
+    """Writes the hash cache into 'root'. Failure only costs a rehash later."""
+    try:
+        with open(os.path.join(root, MANIFEST_NAME), 'w') as f:
+            json.dump({"hash": HASH_NAME, "files": cache}, f)
+    except OSError:
+        pass
+
+
+def _build_manifest(root, dirs=None):
+    """
+    Returns {relpath: hash} for every file under 'root'.
+    Hashes are cached in MANIFEST_NAME and reused while a file's
+    mtime and size are unchanged (like rsync's quick check).
+    Files that do need hashing are hashed in parallel.
+    If 'dirs' (a set) is given, the subfolders' relative paths are added to it.
+    """
+    root = os.fspath(root)
+    cache = _load_manifest_cache(root)
+    new_cache = {}
+    manifest = {}
+    to_hash = [] # (rel, path, stat) of new or changed files
+
+    pending = [("", root)]
+    while pending:
+        rel_prefix, dir_path = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                rel = rel_prefix + entry.name
+                if entry.is_dir():
+                    pending.append((rel + "/", entry.path))
+                    if dirs is not None:
+                        dirs.add(rel)
+                    continue
+                if rel == MANIFEST_NAME:
+                    continue
+                st = entry.stat()
+                cached = cache.get(rel)
+                if (isinstance(cached, list) and len(cached) == 3
+                        and cached[0] == st.st_mtime_ns and cached[1] == st.st_size):
+                    manifest[rel] = cached[2]
+                    new_cache[rel] = cached
+                else:
+                    to_hash.append((rel, entry.path, st))
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=min(COPY_WORKERS, len(to_hash))) as pool:
+            digests = pool.map(_file_hash, [path for rel, path, st in to_hash])
+            for (rel, path, st), digest in zip(to_hash, digests):
+                manifest[rel] = digest
+                new_cache[rel] = [st.st_mtime_ns, st.st_size, digest]
+
+    if new_cache != cache:
+        _save_manifest_cache(root, new_cache)
+    return manifest
+
+
+def _record_manifest(root, manifest):
+    """
+    Stores already-known hashes for the files in 'root' (e.g. right after
+    copying them), so the next sync doesn't have to read them back.
+    """
+    root = os.fspath(root)
+    cache = {}
+    for rel, digest in manifest.items():
+        try:
+            st = os.stat(os.path.join(root, rel))
+        except OSError:
+            continue
+        cache[rel] = [st.st_mtime_ns, st.st_size, digest]
+    _save_manifest_cache(root, cache)
+
+
+def _should_use_rsync(local_path, server_save_path):
+    """
+    Returns True if rsync is installed and the server save folder is on a
+    different filesystem (e.g. a network mount) than the local one.
+    """
+    if os.name != "posix" or shutil.which("rsync") is None:
+        return False
+    return os.stat(local_path).st_dev != os.stat(server_save_path).st_dev
+
+
+def _rsync_upload_files(local_path, server_save_path):
+    """Mirrors the local save folder to the server in a single rsync run."""
+    args = [
+        # -rt --copy-links rather than -a: symlinks are sent as the files
+        # they point to (like our own walkers), and no owner, group or
+        # permission changes, which network shares (e.g. CIFS) reject.
+        # No --inplace: server files may be hardlinked into backups.
+        "rsync", "-rt", "--copy-links", "--delete",
+        "--exclude", "/" + MANIFEST_NAME,
+    ]
+    result = subprocess.run(
+        args + [
+            os.path.join(os.fspath(local_path), ""),
+            os.path.join(os.fspath(server_save_path), ""),
+        ],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"rsync failed ({result.returncode}): {result.stderr.strip()}")
+
+
+def _upload_save_files(local_path, server_save_path, backup_dest, progress=None,
+                       use_rsync=False):
+    """
+    Makes the server save folder match the local one.
+    A new folder at 'backup_dest' (see _reserve_backup_dir) gets a full
+    snapshot of the previous server save (see _snapshot_save).
+    With 'use_rsync', uploads to network mounts go through rsync instead
+    of being copied here.
+    Returns False if the server already matched and nothing was done.
+    """
+    use_rsync = use_rsync and _should_use_rsync(local_path, server_save_path)
+
+    # Only touch files whose contents actually differ
+    local_dirs = set()
+    server_dirs = set()
+    local_manifest = _build_manifest(local_path, local_dirs)
+    server_manifest = _build_manifest(server_save_path, server_dirs)
+    to_copy = {
+        rel for rel, digest in local_manifest.items()
+        if server_manifest.get(rel) != digest
+    }
+    to_delete = server_manifest.keys() - local_manifest.keys()
+    if not to_copy and not to_delete and local_dirs == server_dirs:
+        _record_manifest(server_save_path, local_manifest)
+        return False # Already in sync, don't create an empty backup
+
+    # Snapshot the whole server save into the backup, with hardlinks
+    # where possible (like rsnapshot), so unchanged files share their data
+    # with it. Changed files are then replaced on the server, never
+    # rewritten in place.
+    backed_up = bool(server_manifest or server_dirs)
+    linked = True
+    if backed_up:
+        backup_dest = _reserve_backup_dir(backup_dest)
+        linked = _snapshot_save(server_save_path, backup_dest, server_manifest.keys(), server_dirs)
+    if not linked:
+        to_copy = None # The server folder is empty now, copy everything
+
+    try:
+        if use_rsync:
+            # rsync replaces files rather than rewriting them, so
+            # hardlinked backups keep the old data
+            _rsync_upload_files(local_path, server_save_path)
+        else:
+            if linked:
+                # Remove what's gone locally first, so a folder that is now a
+                # file locally (or the other way around) can be replaced
+                for rel in to_delete:
+                    os.remove(os.path.join(server_save_path, rel))
+                for rel in sorted(server_dirs - local_dirs, reverse=True):
+                    os.rmdir(os.path.join(server_save_path, rel))
+            # Copy the changed local files to the server
+            _parallel_copytree(local_path, server_save_path, files=to_copy, progress=progress)
+    except Exception:
+        # Rollback: put the previous save back and drop the incomplete backup
+        if not linked:
+            _undo_snapshot(server_save_path, backup_dest)
+        else:
+            _restore_snapshot(backup_dest, server_save_path, server_manifest.keys(), server_dirs)
+            if backed_up:
+                shutil.rmtree(backup_dest, ignore_errors=True)
+        raise
+
+    # The server now matches the local manifest
+    _record_manifest(server_save_path, local_manifest)
+    return True
+
+
+def _clear_directory_contents(dir_path: pathlib.Path):
+    """
+    Helper to safely delete all contents of a directory.
+    The folder is swapped for an empty one with a single rename, and
+    the old contents are deleted in the background.
+    """
+    if not dir_path.is_dir():
+        return
+    if dir_path.is_symlink():
+        # e.g. a Proton/Steam save folder. Renaming would move the link
+        # itself, so keep it and delete what it points to in place.
+        _delete_directory_contents(dir_path)
+        return
+    trash_path = dir_path.with_name(f"{dir_path.name}{TRASH_SUFFIX}{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(dir_path, trash_path)
+    except OSError:
+        # e.g. a save file is still open on Windows, delete in place
+        _delete_directory_contents(dir_path)
+        return
+        
+    os.mkdir(dir_path)
+    shutil.copystat(trash_path, dir_path)
+    QThreadPool.globalInstance().start(lambda: _remove_old_trash(dir_path))
+
+
+def _delete_directory_contents(dir_path):
+    """Deletes everything inside a folder, one entry at a time."""
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+
+
+def _remove_old_trash(dir_path: pathlib.Path):
+    """
+    Deletes the old contents _clear_directory_contents left next to
+    'dir_path', including any a previous run didn't get to (e.g. because
+    the app exited first).
+    """
+    prefix = dir_path.name + TRASH_SUFFIX
+    try:
+        with os.scandir(dir_path.parent) as it:
+            trash = [
+                entry.path for entry in it
+                if entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False)
+            ]
+    except OSError:
+        return
+    for path in trash:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _download_save_files(server_save_path, local_path, backup_dest, progress=None):
+    """
+    Replaces the local save folder's contents with the server's.
+    The current local contents are copied into a new folder at
+    'backup_dest' (see _reserve_backup_dir) first.
+    Returns False if both already had the same files and nothing was done.
+    """
+    local_path = pathlib.Path(local_path)
+    # The (cached) manifests tell us without a full read in the common case
+    local_dirs = set()
+    server_dirs = set()
+    if (_build_manifest(local_path, local_dirs) == _build_manifest(server_save_path, server_dirs)
+            and local_dirs == server_dirs):
+        return False
+    
+    # Check if there's anything to back up
+    if _has_entries(local_path):
+        # Back up by copying, then delete contents. Only the download
+        # below reports progress, so the dialog fills once.
+        backup_dest = _reserve_backup_dir(backup_dest)
+        _parallel_copytree(local_path, backup_dest)
+        _clear_directory_contents(local_path)
+    
+    _parallel_copytree(server_save_path, local_path, progress=progress)
+    return True
+
+
+def _latest_mtime(root):
+    """Returns the newest st_mtime_ns of any file or folder under 'root'."""
+    root = os.fspath(root)
+    latest = os.stat(root).st_mtime_ns
+    pending = [root]
+    while pending:
+        dir_path = pending.pop()
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.name == MANIFEST_NAME and dir_path == root:
+                    continue
+                try:
+                    # DirEntry reuses the stat info from the listing where it can
+                    latest = max(latest, entry.stat().st_mtime_ns)
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                except FileNotFoundError:
+                    pass # Deleted while we were looking
+    return latest
+
+
+class SyncWorker(QObject):
+    """
+    Runs a file transfer on a QThread so the GUI stays responsive.
+    'task' is called with a progress(done, total) callback (usually in
+    bytes) and returns its result (usually the message to show).
+    """
+    # qint64, as save folders can be larger than 2 GiB
+    progress = Signal("qint64", "qint64")
+    finished = Signal(object)
+    error = Signal(str)
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+
+    def run(self):
+        try:
+            message = self.task(self.progress.emit)
+        except Exception as e:
+            self.error.emit(str(e))
+        else:
+            self.finished.emit(message)
 
 
 class AddGameDialog(QDialog):
@@ -177,8 +873,8 @@ class WelcomeDialog(QDialog):
         
         try:
             default_data = {"games": []}
-            with open(games_json_path, 'w') as f:
-                json.dump(default_data, f, indent=4)
+            with open(games_json_path, 'wb') as f:
+                f.write(_encode_server_data(default_data))
                 
             QMessageBox.information(
                 self, 
@@ -230,8 +926,8 @@ class WelcomeDialog(QDialog):
                 return
                 
             # Try to parse the JSON to be sure
-            with open(games_json_path, 'r') as f:
-                json.load(f)
+            with open(games_json_path, 'rb') as f:
+                _decode_games(f.read())
 
         except PermissionError:
             QMessageBox.critical(
@@ -272,11 +968,39 @@ class MainWindow(QMainWindow):
         self.settings = settings
         self.server_path = pathlib.Path(self.settings.value(CONFIG_SERVER_PATH))
         self.games_json_path = self.server_path / "games.json"
+        self._games_cache = (None, None) # (stat_key, parsed_games)
+        # {game_id: (save_data path, backup path)} on the server
+        self._paths_cache: dict[str, tuple[pathlib.Path, pathlib.Path]] = {}
         
         # This is the local map of {game_id: local_path_str}
         # Fixed TypeError: Removed 'dict' as a type parameter,
         # it's not supported. {} is a valid default value.
         self.local_game_paths = self.settings.value(CONFIG_GAMES_PATHS, {})
+        self.show_overwrite_warning = self.settings.value(
+            CONFIG_SHOW_OVERWRITE_WARNING, True, bool
+        )
+
+        # Native (inotify/FSEvents/ReadDirectoryChangesW) watcher on the
+        # local save folders and their files, used for auto-upload.
+        # Folders only report added/removed/renamed entries, so the files
+        # are watched too, for games that rewrite a save in place.
+        # Changes are debounced.
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self._on_save_path_changed)
+        self.watcher.fileChanged.connect(self._on_save_file_changed)
+        self._auto_upload_timer = QTimer(self)
+        self._auto_upload_timer.setSingleShot(True)
+        self._auto_upload_timer.setInterval(AUTO_UPLOAD_DELAY_MS)
+        self._auto_upload_timer.timeout.connect(self._maybe_auto_upload)
+        self._changed_save_paths = set()
+        # {game_id: newest mtime in the local save folder at its last sync}
+        self._last_synced_mtime = {}
+        
+        # The running transfer, see _start_sync
+        self._sync_thread = None
+        self._sync_worker = None
+        self._sync_dialog = None
+        self._sync_callbacks = None
 
         # Get a cross-platform-safe path for local backups
         self.local_backup_root = pathlib.Path(
@@ -324,7 +1048,9 @@ class MainWindow(QMainWindow):
         self.set_local_path_button.clicked.connect(self.set_local_path)
         
         self.upload_all_button = QPushButton("Upload All Games")
+        self.upload_all_button.clicked.connect(self.upload_all_saves)
         self.download_all_button = QPushButton("Download All Games")
+        self.download_all_button.clicked.connect(self.download_all_saves)
         
         # Add a "spacer" to push buttons down a bit
         right_layout.addSpacing(20) 
@@ -337,6 +1063,19 @@ class MainWindow(QMainWindow):
         
         right_layout.addWidget(self.upload_all_button)
         right_layout.addWidget(self.download_all_button)
+        
+        self.auto_upload_checkbox = QCheckBox("Auto-upload saves when they change")
+        self.auto_upload_checkbox.setChecked(
+            self.settings.value(CONFIG_AUTO_UPLOAD, False, bool)
+        )
+        self.auto_upload_checkbox.toggled.connect(self.set_auto_upload)
+        right_layout.addWidget(self.auto_upload_checkbox)
+        
+        self.use_rsync = self.settings.value(CONFIG_USE_RSYNC, False, bool)
+        self.use_rsync_checkbox = QCheckBox("Use rsync for network servers (if installed)")
+        self.use_rsync_checkbox.setChecked(self.use_rsync)
+        self.use_rsync_checkbox.toggled.connect(self.set_use_rsync)
+        right_layout.addWidget(self.use_rsync_checkbox)
 
         self.main_layout.addLayout(left_layout, 2)  # 2/3 of space
         self.main_layout.addLayout(right_layout, 1) # 1/3 of space
@@ -344,23 +1083,30 @@ class MainWindow(QMainWindow):
         self.load_games_from_json()
         self.update_ui_state()
         
+        for local_path_str in self.local_game_paths.values():
+            self._watch_save_dir(local_path_str)
+            # Old save contents that weren't deleted before the last exit
+            QThreadPool.globalInstance().start(
+                functools.partial(_remove_old_trash, pathlib.Path(local_path_str))
+            )
+        
     def load_games_from_json(self):
-        """Reads the server 'games.json' and populates the list."""
+        """
+        Reads the server 'games.json' and populates the list.
+        The parsed file is reused while its mtime and size are unchanged.
+        """
         self.game_list_widget.clear()
         try:
-            with open(self.games_json_path, 'r') as f:
-                data = json.load(f)
-            
-            # Add validation for the JSON structure
-            if not isinstance(data, dict):
-                raise TypeError("JSON root is not an object/dictionary")
-            
-            games_list = data.get("games")
-            
-            if not isinstance(games_list, list):
-                 raise TypeError("JSON 'games' key is not a list")
+            st = os.stat(self.games_json_path)
+            stat_key = (st.st_mtime_ns, st.st_size)
+            if stat_key == self._games_cache[0]:
+                games_list = self._games_cache[1]
+            else:
+                with open(self.games_json_path, 'rb') as f:
+                    games_list = _decode_games(f.read())
+                self._games_cache = (stat_key, games_list)
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             QMessageBox.critical(self, "Error Loading Games", f"'games.json' is corrupted and cannot be read.\n\nError: {e}")
             return
         except TypeError as e:
@@ -370,11 +1116,10 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Error Loading Games", f"Could not read 'games.json': {e}")
             return
             
+        # Build all items first, then insert them with updates and signals
+        # off, so the list repaints once instead of once per game
+        items = []
         for game in games_list:
-            if not isinstance(game, dict):
-                print(f"Skipping invalid game entry: {game}")
-                continue
-                
             game_id = game.get("id")
             game_name = game.get("name")
             
@@ -395,7 +1140,17 @@ class MainWindow(QMainWindow):
                     "Select this game and set path."
                 )
             
-            self.game_list_widget.addItem(item)
+            items.append(item)
+        
+        self.game_list_widget.setUpdatesEnabled(False)
+        self.game_list_widget.blockSignals(True)
+        try:
+            for item in items:
+                self.game_list_widget.addItem(item)
+        finally:
+            self.game_list_widget.blockSignals(False)
+            self.game_list_widget.setUpdatesEnabled(True)
+        self.game_list_widget.viewport().update()
                 
         # Removed stray 'except' block here that was causing a syntax error
             
@@ -403,6 +1158,15 @@ class MainWindow(QMainWindow):
 
     def update_ui_state(self):
         """Enables/disables buttons based on selection."""
+        # The bulk buttons work without a selection, on every configured game
+        has_configured_games = any(
+            self.game_list_widget.item(i).data(Qt.ItemDataRole.UserRole).get("id")
+            in self.local_game_paths
+            for i in range(self.game_list_widget.count())
+        )
+        self.upload_all_button.setEnabled(has_configured_games)
+        self.download_all_button.setEnabled(has_configured_games)
+        
         selected_item = self.get_selected_game_item()
         
         if not selected_item:
@@ -434,10 +1198,15 @@ class MainWindow(QMainWindow):
             self.upload_button.setEnabled(True)
             self.download_button.setEnabled(True)
             self.set_local_path_button.setVisible(False) # Hide the "Set Path" button
-            
-        # TODO: Logic for enabling/disabling bulk buttons
-        self.upload_all_button.setEnabled(self.game_list_widget.count() > 0)
-        self.download_all_button.setEnabled(self.game_list_widget.count() > 0)
+
+    def _game_paths(self, game_id):
+        """Returns the (cached) server save_data and backup paths for a game."""
+        paths = self._paths_cache.get(game_id)
+        if paths is None:
+            game_server_dir = self.server_path / game_id
+            paths = (game_server_dir / "save_data", game_server_dir / "backup")
+            self._paths_cache[game_id] = paths
+        return paths
 
     def get_selected_game_item(self) -> QListWidgetItem | None:
         """Helper to get the currently selected list item."""
@@ -468,18 +1237,13 @@ class MainWindow(QMainWindow):
         # Save the new path to our local settings
         self.local_game_paths[game_id] = path_str
         self.settings.setValue(CONFIG_GAMES_PATHS, self.local_game_paths)
+        self._watch_save_dir(path_str)
         
-        # Reload the game list to remove the "greyed out" style
-        # and update the UI to show the correct buttons
-        self.load_games_from_json()
-        
-        # Reselect the item that was just configured
-        for i in range(self.game_list_widget.count()):
-            item = self.game_list_widget.item(i)
-            if item.data(Qt.ItemDataRole.UserRole).get("id") == game_id:
-                item.setSelected(True)
-                break
-                
+        # Clear the "greyed out" style on just this item, instead of
+        # re-reading 'games.json' from the server. It's still selected.
+        selected_item.setForeground(self.palette().text())
+        selected_item.setToolTip("")
+
         self.update_ui_state()
 
     def add_new_game(self):
@@ -500,22 +1264,22 @@ class MainWindow(QMainWindow):
             # --- 1. Create Server Directories FIRST ---
             # If this fails, we haven't touched the JSON file.
             try:
-                game_server_dir = self.server_path / game_id
-                (game_server_dir / "save_data").mkdir(parents=True, exist_ok=True)
-                (game_server_dir / "backup").mkdir(parents=True, exist_ok=True)
+                server_save_path, server_backup_path = self._game_paths(game_id)
+                game_server_dir = server_save_path.parent
+                server_save_path.mkdir(parents=True, exist_ok=True)
+                server_backup_path.mkdir(parents=True, exist_ok=True)
             except Exception as e:
                 QMessageBox.critical(self, "Server Error", f"Could not create server directories: {e}")
                 return
 
             # --- 2. Update Server 'games.json' (Atomically) ---
-            games_json_temp_path = self.games_json_path.with_suffix(".json.tmp")
             try:
                 # Read existing data
-                with open(self.games_json_path, 'r') as f:
-                    server_data = json.load(f)
+                with open(self.games_json_path, 'rb') as f:
+                    server_data = _decode_server_data(f.read())
                 
                 # Check for duplicate game name (case-insensitive)
-                existing_names = [g['name'].lower() for g in server_data.get("games", [])]
+                existing_names = {g['name'].lower() for g in server_data.get("games", ())}
                 if game_name.lower() in existing_names:
                     QMessageBox.warning(self, "Duplicate Game", f"A game named '{game_name}' already exists.")
                     # Rollback: delete the directories we just made
@@ -525,12 +1289,8 @@ class MainWindow(QMainWindow):
                 # Add new game
                 server_data["games"].append(new_game_data)
                 
-                # Write to temp file
-                with open(games_json_temp_path, 'w') as f:
-                    json.dump(server_data, f, indent=4)
-                
-                # Atomic rename operation (safer)
-                os.rename(games_json_temp_path, self.games_json_path)
+                # Write to a temp file, then atomically replace (safer)
+                _write_file_atomic(self.games_json_path, _encode_server_data(server_data))
                     
             except Exception as e:
                 QMessageBox.critical(self, "Server Error", f"Could not update 'games.json': {e}")
@@ -540,16 +1300,255 @@ class MainWindow(QMainWindow):
                 except Exception as e_roll:
                     QMessageBox.critical(self, "Rollback Error", f"Failed to update JSON and also failed to clean up directories: {e_roll}")
                 return
+
+            # Fill the cache with what we just wrote, so the reload below
+            # doesn't read 'games.json' back from the server
+            try:
+                st = os.stat(self.games_json_path)
+                self._games_cache = ((st.st_mtime_ns, st.st_size), _games_from_data(server_data))
+            except (OSError, TypeError):
+                pass # Only costs a re-read
                 
             # --- 3. Save Local Path ---
+            self.local_game_paths[game_id] = str(local_path)
+            self.settings.setValue(CONFIG_GAMES_PATHS, self.local_game_paths)
+            self._watch_save_dir(str(local_path))
+            
+            # --- 4. Reload the game list ---
+            self.load_games_from_json()
+
+    def closeEvent(self, event):
+        """Flushes QSettings to disk once, instead of after every change."""
+        if self._sync_thread is not None:
+            QMessageBox.warning(
+                self, "Transfer in Progress",
+                "Please wait for the current transfer to finish before closing."
+            )
+            event.ignore()
+            return
+        self.settings.sync()
+        super().closeEvent(event)
+
+    def set_auto_upload(self, enabled):
+        """Saves the auto-upload preference."""
+        self.settings.setValue(CONFIG_AUTO_UPLOAD, enabled)
+
+    def set_use_rsync(self, enabled):
+        """Saves the rsync preference (read by the worker, so kept as a bool)."""
+        self.use_rsync = enabled
+        self.settings.setValue(CONFIG_USE_RSYNC, enabled)
+
+    def _watch_save_dir(self, local_path_str):
+        """Watches a local save folder, its subfolders and files for changes."""
+        if not os.path.isdir(local_path_str):
+            return
+        watched = set(self.watcher.directories())
+        watched.update(self.watcher.files())
+        new_paths = []
+        for dir_path, dir_names, file_names in os.walk(local_path_str, followlinks=True):
+            if dir_path not in watched:
+                new_paths.append(dir_path)
+            is_root = dir_path == local_path_str
+            for name in file_names:
+                file_path = os.path.join(dir_path, name)
+                if file_path not in watched and not (is_root and name == MANIFEST_NAME):
+                    new_paths.append(file_path)
+        if new_paths:
+            self.watcher.addPaths(new_paths)
+
+    def _unwatch_save_dir(self, local_path_str):
+        """Stops watching a local save folder, its subfolders and files."""
+        root = os.path.normpath(local_path_str)
+        watched = [
+            p for p in self.watcher.directories() + self.watcher.files()
+            if os.path.normpath(p) == root
+            or os.path.normpath(p).startswith(root + os.sep)
+        ]
+        if watched:
+            self.watcher.removePaths(watched)
+
+    def _on_save_path_changed(self, path):
+        """Restarts the debounce timer whenever a watched path changes."""
+        self._changed_save_paths.add(path)
+        self._auto_upload_timer.start()
+
+    def _on_save_file_changed(self, path):
+        """
+        Handles a changed save file. A file that was replaced (or deleted)
+        is no longer watched, so it's added back if it's there.
+        """
+        if os.path.isfile(path) and path not in self.watcher.files():
+            self.watcher.addPath(path)
+        self._on_save_path_changed(path)
+
+    def _maybe_auto_upload(self):
+        """
+        Uploads the saves of games whose local folders changed, if
+        auto-upload is enabled and something is newer than the last sync.
+        """
+        changed_paths = self._changed_save_paths
+        self._changed_save_paths = set()
+        if not self.auto_upload_checkbox.isChecked():
+            return
+
+        if self._sync_thread is not None:
+            # Try again once the current transfer is done
+            self._changed_save_paths |= changed_paths
+            self._auto_upload_timer.start()
+            return
+
+        jobs = []
+        for game_id, local_path_str in self.local_game_paths.items():
+            local_root = os.path.normpath(local_path_str)
+            if not any(
+                os.path.normpath(p) == local_root
+                or os.path.normpath(p).startswith(local_root + os.sep)
+                for p in changed_paths
+            ):
+                continue
+
+            item = self._find_game_item(game_id)
+            if item is None:
+                continue # Not on this server
+            game_name = item.data(Qt.ItemDataRole.UserRole)["name"]
+
+            # New subfolders or files may have appeared
+            self._watch_save_dir(local_path_str)
+            
+            # Skip if nothing changed since we last synced
+            try:
+                if _latest_mtime(local_path_str) == self._last_synced_mtime.get(game_id):
+                    continue
+            except OSError:
+                continue
+            jobs.append((game_id, game_name, local_path_str))
+
+        if not jobs:
+            return
+
+        timestamp = time.strftime(BACKUP_TIMESTAMP_FORMAT)
+
+        def task(progress):
+            results = []
+            succeeded = set() # IDs of the games that are now on the server
+            for game_id, game_name, local_path_str in jobs:
+                server_save_path, server_backup_path = self._game_paths(game_id)
+                backup_dest = server_backup_path / timestamp
+                try:
+                    if _upload_save_files(
+                        local_path_str, server_save_path, backup_dest,
+                        use_rsync=self.use_rsync
+                    ):
+                        results.append(f"Auto-uploaded save for '{game_name}'.")
+                    else:
+                        results.append(f"'{game_name}' is already up to date on the server.")
+                    succeeded.add(game_id)
+                except Exception as e:
+                    results.append(f"Auto-upload failed for '{game_name}': {e}")
+            return " ".join(results), succeeded
+
+        def finished(result):
+            message, succeeded = result
+            for game_id, game_name, local_path_str in jobs:
+                if game_id in succeeded:
+                    self._mark_synced(game_id, local_path_str)
+                else:
+                    # Try again later, even if the folder doesn't change
+                    QTimer.singleShot(
+                        AUTO_UPLOAD_RETRY_MS, self,
+                        functools.partial(self._on_save_path_changed, local_path_str)
+                    )
+            self.statusBar().showMessage(message)
+
+        self._start_sync(
+            task, finished,
+            lambda message: self.statusBar().showMessage(f"Auto-upload failed: {message}")
+        )
+
+    def _mark_synced(self, game_id, local_path_str):
+        """Remembers the local save folder's state so it isn't auto-uploaded."""
+        try:
+            self._last_synced_mtime[game_id] = _latest_mtime(local_path_str)
+        except OSError:
+            self._last_synced_mtime.pop(game_id, None)
+
+    def _start_sync(self, task, on_finished, on_error, progress_label=None):
+        """
+        Runs 'task' on a SyncWorker thread (see SyncWorker).
+        'on_finished' or 'on_error' is then called with its message.
+        If 'progress_label' is given, a modal progress dialog is shown.
+        Returns False if another transfer is still running.
+        """
+        if self._sync_thread is not None:
+            return False
+
+        self._sync_thread = QThread(self)
+        self._sync_worker = SyncWorker(task)
+        self._sync_worker.moveToThread(self._sync_thread)
+        self._sync_callbacks = (on_finished, on_error)
+        
+        # Connected to our own slots, so they run on the GUI thread
+        self._sync_thread.started.connect(self._sync_worker.run)
+        self._sync_worker.progress.connect(self._on_sync_progress)
+        self._sync_worker.finished.connect(self._on_sync_finished)
+        self._sync_worker.error.connect(self._on_sync_error)
+
+        if progress_label:
+            self._sync_dialog = QProgressDialog(progress_label, "", 0, 0, self)
+            self._sync_dialog.setWindowTitle("Rayforge Sync")
+            self._sync_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            self._sync_dialog.setCancelButton(None)
+            self._sync_dialog.setMinimumDuration(500)
+            self._sync_dialog.setValue(0)
+
+        self._sync_thread.start()
+        return True
+
+    def _on_sync_progress(self, done, total):
+        """Updates the progress dialog, scaling values to fit its int range."""
+        if self._sync_dialog is not None:
+            shift = max(0, total.bit_length() - 31)
+            self._sync_dialog.setMaximum(max(1, total >> shift))
+            self._sync_dialog.setValue(done >> shift)
+
+    def _on_sync_finished(self, message):
+        on_finished, on_error = self._end_sync()
+        on_finished(message)
+
+    def _on_sync_error(self, message):
+        on_finished, on_error = self._end_sync()
+        on_error(message)
+
+    def _end_sync(self):
+        """Cleans up after a transfer and returns its callbacks."""
+        if self._sync_dialog is not None:
+            self._sync_dialog.close()
+            self._sync_dialog.deleteLater()
+        self._sync_thread.quit()
+        self._sync_thread.wait()
+        self._sync_worker.deleteLater()
+        self._sync_thread.deleteLater()
+        callbacks = self._sync_callbacks
+        self._sync_thread = None
+        self._sync_worker = None
+        self._sync_dialog = None
+        self._sync_callbacks = None
+        return callbacks
+
+    def _find_game_item(self, game_id):
+        """Returns the list item for a game ID, or None if it isn't listed."""
+        for i in range(self.game_list_widget.count()):
+            item = self.game_list_widget.item(i)
+            if item.data(Qt.ItemDataRole.UserRole).get("id") == game_id:
+                return item
+        return None
+
     def _show_overwrite_warning(self, title, text):
         """
         Shows a confirmation dialog with a "Don't show again" checkbox.
         Returns True if user clicks OK, False if Cancel.
         """
-        show_warning = self.settings.value(CONFIG_SHOW_OVERWRITE_WARNING, True, bool)
-        
-        if not show_warning:
+        if not self.show_overwrite_warning:
             return True # User has already opted out of warnings
 
         msg_box = QMessageBox(self)
@@ -564,25 +1563,16 @@ class MainWindow(QMainWindow):
         result = msg_box.exec()
         
         if checkbox.isChecked():
+            self.show_overwrite_warning = False
             self.settings.setValue(CONFIG_SHOW_OVERWRITE_WARNING, False)
             
         return result == QMessageBox.StandardButton.Ok
 
-    def _clear_directory_contents(self, dir_path: pathlib.Path):
-        """Helper to safely delete all contents of a directory."""
-        if not dir_path.is_dir():
-            return
-        for item in dir_path.iterdir():
-            if item.is_dir():
-                shutil.rmtree(item)
-            else:
-                os.remove(item)
-
     def upload_save(self):
         """
         Uploads the local save data to the server.
-        1. Backs up the current server save.
-        2. Copies the local save files to the server.
+        1. Backs up the server files that are about to change.
+        2. Copies the changed local save files to the server.
         """
         selected_item = self.get_selected_game_item()
         if not selected_item: return
@@ -603,29 +1593,32 @@ class MainWindow(QMainWindow):
         ):
             return # User cancelled
 
-        try:
-            local_path = pathlib.Path(local_path_str)
-            server_save_path = self.server_path / game_id / "save_data"
-            server_backup_path = self.server_path / game_id / "backup"
-            
-            # 1. Create timestamped backup on server
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            backup_dest = server_backup_path / timestamp
-            
-            # Check if there's anything to back up
-            if any(server_save_path.iterdir()):
-                shutil.move(str(server_save_path), str(backup_dest))
-                # Re-create the now-moved 'save_data' directory
-                server_save_path.mkdir()
-            
-            # 2. Copy local files to server
-            # We copy the *contents* of the local path
-            shutil.copytree(str(local_path), str(server_save_path), dirs_exist_ok=True)
+        local_path = pathlib.Path(local_path_str)
+        server_save_path, server_backup_path = self._game_paths(game_id)
+        
+        # 1. Changed server files go into a timestamped backup
+        timestamp = time.strftime(BACKUP_TIMESTAMP_FORMAT)
+        backup_dest = server_backup_path / timestamp
+        
+        # 2. Copy the changed local files to the server (in the background)
+        # Comparing the saves means hashing them, so that's done there too.
+        def task(progress):
+            if not _upload_save_files(
+                local_path, server_save_path, backup_dest, progress,
+                use_rsync=self.use_rsync
+            ):
+                return f"The server save for '{game_name}' already matches this PC."
+            return f"Successfully uploaded save for '{game_name}'."
 
-            QMessageBox.information(self, "Upload Complete", f"Successfully uploaded save for '{game_name}'.")
+        def finished(message):
+            self._mark_synced(game_id, local_path_str)
+            QMessageBox.information(self, "Upload Complete", message)
 
-        except Exception as e:
-            QMessageBox.critical(self, "Upload Failed", f"An error occurred: {e}")
+        def failed(message):
+            QMessageBox.critical(self, "Upload Failed", f"An error occurred: {message}")
+
+        if not self._start_sync(task, finished, failed, f"Uploading '{game_name}'..."):
+            QMessageBox.warning(self, "Busy", "Another transfer is still running.")
         
     def download_save(self):
         """
@@ -652,30 +1645,137 @@ class MainWindow(QMainWindow):
         ):
             return # User cancelled
 
-        try:
-            local_path = pathlib.Path(local_path_str)
-            server_save_path = self.server_path / game_id / "save_data"
-            
-            # 1. Create timestamped local backup
-            timestamp = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            # Use the app's config folder for its *own* backups
-            backup_dest = self.local_backup_root / game_id / timestamp
-            backup_dest.mkdir(parents=True, exist_ok=True)
-            
-            # Check if there's anything to back up
-            if any(local_path.iterdir()):
-                # Back up by copying, then delete contents
-                shutil.copytree(str(local_path), str(backup_dest), dirs_exist_ok=True)
-                self._clear_directory_contents(local_path)
-            
-            # 2. Copy server files to local machine
-            shutil.copytree(str(server_save_path), str(local_path), dirs_exist_ok=True)
+        local_path = pathlib.Path(local_path_str)
+        server_save_path = self._game_paths(game_id)[0]
+        
+        # 1. Create timestamped local backup
+        timestamp = time.strftime(BACKUP_TIMESTAMP_FORMAT)
+        # Use the app's config folder for its *own* backups
+        backup_dest = self.local_backup_root / game_id / timestamp
+        
+        # 2. Copy server files to local machine (in the background)
+        def task(progress):
+            if not _download_save_files(server_save_path, local_path, backup_dest, progress):
+                return f"Your local save for '{game_name}' already matches the server."
+            return f"Successfully downloaded save for '{game_name}'."
 
-            QMessageBox.information(self, "Download Complete", f"Successfully downloaded save for '{game_name}'.")
+        def finished(message):
+            # Don't auto-upload what we just downloaded
+            self._mark_synced(game_id, local_path_str)
+            self._watch_save_dir(local_path_str)
+            QMessageBox.information(self, "Download Complete", message)
+
+        def failed(message):
+            self._watch_save_dir(local_path_str)
+            QMessageBox.critical(self, "Download Failed", f"An error occurred: {message}")
+
+        # The folder gets swapped out, and the watcher would follow the old one
+        self._unwatch_save_dir(local_path_str)
+        if not self._start_sync(task, finished, failed, f"Downloading '{game_name}'..."):
+            self._watch_save_dir(local_path_str)
+            QMessageBox.warning(self, "Busy", "Another transfer is still running.")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Download Failed", f"An error occurred: {e}")
 
+    def upload_all_saves(self):
+        """Uploads the saves of every game configured on this PC."""
+        self._sync_all_saves(upload=True)
+
+    def download_all_saves(self):
+        """Downloads the saves of every game configured on this PC."""
+        self._sync_all_saves(upload=False)
+
+    def _sync_all_saves(self, upload):
+        """
+        Uploads or downloads all games that have a local path on this PC.
+        Games are independent, so a few are transferred at once to hide
+        the server's latency, and a single summary is shown at the end.
+        """
+        games = []
+        for i in range(self.game_list_widget.count()):
+            game_data = self.game_list_widget.item(i).data(Qt.ItemDataRole.UserRole)
+            local_path_str = self.local_game_paths.get(game_data["id"])
+            if local_path_str:
+                games.append((game_data["id"], game_data["name"], local_path_str))
+                
+        if not games:
+            QMessageBox.information(
+                self, "Nothing to Sync",
+                "None of the games have a local save directory set on this PC."
+            )
+            return
+
+        if upload:
+            confirmed = self._show_overwrite_warning(
+                "Confirm Upload",
+                f"This will overwrite the server save data for {len(games)} game(s).\n\n"
+                "The existing server data will be backed up. Continue?"
+            )
+        else:
+            confirmed = self._show_overwrite_warning(
+                "Confirm Download",
+                f"This will overwrite your local save data for {len(games)} game(s).\n\n"
+                "Your existing local data will be backed up. Continue?"
+            )
+        if not confirmed:
+            return # User cancelled
+
+        # One timestamp for the whole batch
+        timestamp = time.strftime(BACKUP_TIMESTAMP_FORMAT)
+
+        def sync_game(game):
+            game_id, game_name, local_path_str = game
+            server_save_path, server_backup_path = self._game_paths(game_id)
+            try:
+                if upload:
+                    backup_dest = server_backup_path / timestamp
+                    changed = _upload_save_files(
+                        local_path_str, server_save_path, backup_dest,
+                        use_rsync=self.use_rsync
+                    )
+                else:
+                    backup_dest = self.local_backup_root / game_id / timestamp
+                    changed = _download_save_files(server_save_path, local_path_str, backup_dest)
+                return True, f"{game_name}: done" if changed else f"{game_name}: already in sync"
+            except Exception as e:
+                return False, f"{game_name}: failed ({e})"
+
+        def task(progress):
+            with ThreadPoolExecutor(max_workers=min(BULK_SYNC_WORKERS, len(games))) as pool:
+                futures = [pool.submit(sync_game, game) for game in games]
+                for done, future in enumerate(as_completed(futures), 1):
+                    progress(done, len(games))
+            results = [future.result() for future in futures]
+            message = "\n".join(line for ok, line in results)
+            succeeded = {game[0] for game, (ok, line) in zip(games, results) if ok}
+            return message, succeeded
+
+        def rewatch():
+            if not upload:
+                for game_id, game_name, local_path_str in games:
+                    self._watch_save_dir(local_path_str)
+
+        def finished(result):
+            message, succeeded = result
+            for game_id, game_name, local_path_str in games:
+                if game_id in succeeded:
+                    self._mark_synced(game_id, local_path_str)
+            rewatch()
+            title = "Upload All Complete" if upload else "Download All Complete"
+            QMessageBox.information(self, title, message)
+
+        def failed(message):
+            rewatch()
+            title = "Upload All Failed" if upload else "Download All Failed"
+            QMessageBox.critical(self, title, f"An error occurred: {message}")
+
+        if not upload:
+            # The folders get swapped out, and the watcher would follow the old ones
+            for game_id, game_name, local_path_str in games:
+                self._unwatch_save_dir(local_path_str)
+        label = "Uploading all games..." if upload else "Downloading all games..."
+        if not self._start_sync(task, finished, failed, label):
+            rewatch()
+            QMessageBox.warning(self, "Busy", "Another transfer is still running.")
 
 def main():
     """
@@ -714,19 +1814,36 @@ def main():
         # We have a server path, proceed to main window.
         # We should also validate this path, in case the drive
         # is disconnected.
+        # A check that passed within the last minute is trusted as-is
+        checked_at = settings.value(CONFIG_SERVER_CHECKED_AT, 0.0, float)
+        recently_checked = 0 <= time.time() - checked_at < SERVER_CHECK_TTL
+        
         try:
             server_path_obj = pathlib.Path(server_path)
-            if not (server_path_obj / "games.json").is_file():
-                QMessageBox.critical(
-                    None, 
-                    "Server Not Found",
-                    f"Could not find 'games.json' at the configured path:\n{server_path}\n\n"
-                    "The server may be disconnected or the file is missing.\n"
-                    "Rayforge Sync will now exit."
-                )
-                settings.remove(CONFIG_SERVER_PATH) # Clear the bad path
-                sys.exit(1)
+            if not recently_checked:
+                if not _is_file_with_timeout(server_path_obj / "games.json", SERVER_CHECK_TIMEOUT):
+                    QMessageBox.critical(
+                        None, 
+                        "Server Not Found",
+                        f"Could not find 'games.json' at the configured path:\n{server_path}\n\n"
+                        "The server may be disconnected or the file is missing.\n"
+                        "Rayforge Sync will now exit."
+                    )
+                    settings.remove(CONFIG_SERVER_PATH) # Clear the bad path
+                    settings.remove(CONFIG_SERVER_CHECKED_AT)
+                    sys.exit(1)
+                settings.setValue(CONFIG_SERVER_CHECKED_AT, time.time())
         
+        except TimeoutError:
+            QMessageBox.critical(
+                None, 
+                "Server Not Found",
+                f"Could not find 'games.json' at the configured path:\n{server_path}\n\n"
+                "The server may be disconnected or the file is missing.\n"
+                "Rayforge Sync will now exit."
+            )
+            # We don't clear the path, as it might be a temporary connection issue
+            sys.exit(1)
         except PermissionError:
             QMessageBox.critical(
                 None,